@@ -1,58 +1,277 @@
 # Built-in modules included by default in Python environments
 import sys  # Module for interacting with the system
 import os  # Module for interacting with the operating system
-import time  # Module for time-related operations
+import functools  # Used for caching the MongoDB client
+import itertools  # Used for chaining the cached chunks of employees
+import importlib.util  # Used for checking which optional modules are installed
+import re  # Module for regular expressions
+import operator  # Used for reading several attributes in a single call
+import ctypes  # Used for calling the Windows console API
+import hmac  # Used for comparing passwords in constant time
+from concurrent.futures import ThreadPoolExecutor  # Used for running reads in the background
 from dataclasses import dataclass  # Used for creating data classes
 from typing import Optional  # Used for type hinting
 from bson import ObjectId  # Used for representing MongoDB ObjectIds
+from bson.errors import InvalidId  # Raised for strings that are not valid ObjectIds
 
 # Third-party modules requiring installation
-import keyboard  # Windows-specific module for getting keypresses
-from colorama import Fore, Style  # Library for colored output
-from pymongo import MongoClient  # MongoDB driver for Python
+from colorama import Fore, init  # Library for colored output
+from pymongo import MongoClient, InsertOne  # MongoDB driver for Python
 import pymongo.errors  # Import pymongo.errors module
-from tabulate import tabulate  # Library for creating formatted tables from data
 from dotenv import (
     load_dotenv,
 )  # Library for loading environment variables from a .env file
 
 load_dotenv()  # Load environment variables from .env file if present
 
+# Reset the color after every write, so colored messages do not need a reset code
+init(autoreset=True)
+
+# Number of employees formatted and printed per table in the employees list
+TABLE_CHUNK_SIZE = 100
+
+# Names of the Employee fields stored in the employee documents
+_EMPLOYEE_FIELDS = ("name", "designation", "salary", "age", "phone", "address")
+
+# Fields of the employee documents fetched from the database
+_PROJECTION = dict.fromkeys(("_id", *_EMPLOYEE_FIELDS), 1)
+
+# Read the stored fields of an Employee or an employee document in a single call
+_get_employee_fields = operator.attrgetter(*_EMPLOYEE_FIELDS)
+_get_document_fields = operator.itemgetter(*_EMPLOYEE_FIELDS)
+
+# Text search score of a document, used for sorting the best matching employees first
+_TEXT_SCORE = {"$meta": "textScore"}
+
+# Characters that make a search term a regular expression instead of plain words
+_REGEX_METACHARACTERS = re.compile(r"[\\^$.|?*+()\[\]{}]")
+
+# Patterns checked by the Validator class, matched against the whole input
+# ASCII digits only, so the input can always be converted with int()
+_DIGIT_RE = re.compile(r"[0-9]+")
+_PHONE_RE = re.compile(r"[0-9]{10}")
+
+# Bound match methods of the patterns, looked up once instead of on every check
+_match_digits = _DIGIT_RE.fullmatch
+_match_phone = _PHONE_RE.fullmatch
+
+# Bounds checked by the Validator class
+MIN_SALARY = 500
+MIN_AGE = 18
+MAX_AGE = 99
+
+# Search terms starting with this prefix match anywhere in the fields, ignoring case
+SUBSTRING_SEARCH_PREFIX = "*"
+
+
+# Menus of the system, each printed with a single write to the terminal
+LOGIN_MENU = """
+                    ================================
+                       EMPLOYEE MANAGEMENT SYSTEM    
+                    ================================
+                    
+                          *** LOGIN MENU ***      
+                     ______________________________
+                    |                              |
+                    |_______ 1) Login _____________|
+                    |                              |
+                    |_______ 2) Exit ______________|
+                    |                              |
+                    |______________________________|
+                    
+"""
+
+MAIN_MENU = """
+                    ==================================
+                        EMPLOYEE MANAGEMENT SYSTEM    
+                    ==================================
+                    
+                           *** MAIN MENU ***       
+                     ________________________________
+                    |                                |
+                    |____ 1) View Employees List ____|
+                    |                                |
+                    |____ 2) Edit Employees List ____|
+                    |                                |
+                    |____ 3) Search Record __________|
+                    |                                |
+                    |____ 4) Logout_________________ |
+                    |                                |
+                    |________________________________|
+                
+"""
+
+EDIT_MENU = """
+                    ============================
+                     EMPLOYEE MANAGEMENT SYSTEM  
+                    ============================
+                    
+                    *** EDIT EMPLOYEE LIST ***
+                     __________________________
+                    |                          |
+                    |______ 1) Add ____________|
+                    |                          |
+                    |______ 2) Modify _________|
+                    |                          |
+                    |______ 3) Delete _________|
+                    |                          |
+                    |______ 4) Main Menu ______|
+                    |                          |
+                    |__________________________|
+                    
+"""
+
+# Encode the menus once, with the line endings the text layer would have written,
+# so printing them writes the bytes directly without going through the text encoder
+LOGIN_MENU, MAIN_MENU, EDIT_MENU = (
+    menu.replace("\n", os.linesep).encode()
+    for menu in (LOGIN_MENU, MAIN_MENU, EDIT_MENU)
+)
+
+# Columns of the employee tables, which are also the labels of the employee details,
+# and the width of the label column of the employee details table
+_EMPLOYEE_COLUMNS = ("ID", "Name", "Designation", "Salary", "Age", "Phone", "Address")
+_DETAIL_LABEL_WIDTH = max(map(len, _EMPLOYEE_COLUMNS))
+
+# Indexes of the free-text columns (name, designation, address), which tabulate
+# does not need to check for numbers cell by cell
+_TEXT_COLUMNS = [1, 2, 6]
+
+# Label column parts of the borders of the employee details table,
+# drawn like tabulate's "fancy_grid" format
+_DETAIL_TOP = "╒" + "═" * (_DETAIL_LABEL_WIDTH + 2) + "╤"
+_DETAIL_SEPARATOR = "├" + "─" * (_DETAIL_LABEL_WIDTH + 2) + "┼"
+_DETAIL_BOTTOM = "╘" + "═" * (_DETAIL_LABEL_WIDTH + 2) + "╧"
+
+# Colors of the error, information and success messages
+_RED = Fore.RED
+_BLUE = Fore.BLUE
+_GREEN = Fore.GREEN
+
+
+# The module below is slow to import and is not needed to show the login menu,
+# so it is only imported the first time it is used
+@functools.cache
+def _get_tabulate():
+    """
+    Import the tabulate function, used for creating formatted tables from data.
+    """
+    from tabulate import tabulate
+
+    return tabulate
+
+
+@functools.cache
+def _get_display_width():
+    """
+    Get the function measuring how many columns a string takes up in the terminal.
+
+    tabulate measures wide characters such as CJK letters with wcwidth when it is
+    installed and falls back to len otherwise, so the same function is used here.
+    """
+    if importlib.util.find_spec("wcwidth") is None:
+        return len
+    from wcwidth import wcswidth
+
+    return wcswidth
+
+
+def wait_enter_or_esc():
+    """
+    Waits for a single key to be typed in the console.
+
+    The key is read straight from the console with msvcrt, without echoing it and
+    without a global keyboard hook, so no delay is needed before or after reading it.
+
+    Returns:
+    - str or None: 'enter' or 'esc' if one of those keys was pressed, None otherwise.
+    """
+    # msvcrt only exists on Windows, so it is imported here instead of at the top,
+    # which keeps the module importable on other platforms
+    import msvcrt
+
+    key = msvcrt.getwch()
+    if key == "\r":
+        return "enter"
+    if key == "\x1b":
+        return "esc"
+    if key in ("\x00", "\xe0"):
+        # Arrow and function keys send a second character, which is discarded so it
+        # is not read as a separate key
+        msvcrt.getwch()
+    return None
+
+
+def enable_virtual_terminal():
+    """
+    Enables the processing of ANSI escape sequences in the Windows console.
+
+    This only needs to be done once at startup, so that clear_screen can clear
+    the terminal with an escape sequence instead of running the 'cls' command.
+    """
+    kernel32 = ctypes.windll.kernel32
+    # Handle of the console screen buffer (STD_OUTPUT_HANDLE)
+    handle = kernel32.GetStdHandle(-11)
+    mode = ctypes.c_ulong()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        # Add ENABLE_VIRTUAL_TERMINAL_PROCESSING to the current console mode
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+
 
 def clear_screen():
     """
     Clears the terminal screen.
     """
-    os.system("cls")
+    # Erase the whole screen and move the cursor to the top left corner
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
 
 def pause_screen():
     """
     Pauses the screen and waits for a keypress from the user.
     """
-    print()
-    os.system("pause")
+    # Windows-specific module for reading keypresses from the console
+    import msvcrt
+
+    sys.stdout.write("\nPress any key to continue . . . ")
+    sys.stdout.flush()
+    # Special keys such as the arrow keys send a prefix code followed by the key code
+    if msvcrt.getch() in (b"\x00", b"\xe0"):
+        msvcrt.getch()
+    sys.stdout.write("\n")
+
+
+def print_menu(menu):
+    """
+    Print an encoded menu with a single write and flush of the terminal output.
+    """
+    # Flush any pending text first so the menu is printed after it
+    sys.stdout.flush()
+    sys.stdout.buffer.write(menu)
+    sys.stdout.buffer.flush()
 
 
 def print_error_message(message):
     """
     Print an error message in red color.
     """
-    print("\n" + Fore.RED + message + Style.RESET_ALL)
+    sys.stdout.write(f"\n{_RED}{message}\n")
 
 
 def print_information_message(message):
     """
     Print an information message in blue color.
     """
-    print("\n" + Fore.BLUE + message + Style.RESET_ALL, end="", flush=True)
+    sys.stdout.write(f"\n{_BLUE}{message}")
+    sys.stdout.flush()
 
 
 def print_success_message(message):
     """
     Print a success message in green color.
     """
-    print("\n" + Fore.GREEN + message + Style.RESET_ALL)
+    sys.stdout.write(f"\n{_GREEN}{message}\n")
 
 
 def get_valid_input(prompt, validator_function, allow_blank=False):
@@ -96,7 +315,8 @@ class Validator:
         - bool: True if the name contains only alphabetic characters, False otherwise.
         """
 
-        # Check if the name, after removing spaces, contains only alphabetic characters
+        # Check if the name contains only alphabetic characters and spaces
+        # str.isalpha accepts any Unicode letter, but not numeric characters like '²'
         if name.replace(" ", "").isalpha():
             return True
         print_error_message("Name must contain only alphabetic characters.")
@@ -114,7 +334,7 @@ class Validator:
         - bool: True if the designation contains only alphabetic characters, False otherwise.
         """
 
-        # Check if the designation, after removing spaces, contains only alphabetic characters
+        # Check if the designation contains only alphabetic characters and spaces
         if designation.replace(" ", "").isalpha():
             return True
         print_error_message("Designation must contain only alphabetic characters.")
@@ -129,14 +349,15 @@ class Validator:
         - salary (str): The salary to validate.
 
         Returns:
-        - bool: True if the salary is at least 500 and in a valid format, False otherwise.
+        - bool: True if the salary is at least MIN_SALARY and in a valid format,
+                False otherwise.
         """
 
-        # Check if salary is a digit and greater than or equal to 500
-        if salary.isdigit() and int(salary) >= 500:
+        # Check if salary is a digit and greater than or equal to MIN_SALARY
+        if _match_digits(salary) is not None and int(salary) >= MIN_SALARY:
             return True
         print_error_message(
-            "Salary must be at least 500 and in a valid numeric format."
+            f"Salary must be at least {MIN_SALARY} and in a valid numeric format."
         )
         return False
 
@@ -149,14 +370,16 @@ class Validator:
         - age (str): The age to validate.
 
         Returns:
-        - bool: True if the age is from 18 to 99 and in a valid format, False otherwise.
+        - bool: True if the age is from MIN_AGE to MAX_AGE and in a valid format,
+                False otherwise.
         """
 
-        # Check if age is a digit and within the range of 18 to 99
-        if age.isdigit() and 18 <= int(age) <= 99:
+        # Check if age is a digit and within the range of MIN_AGE to MAX_AGE
+        if _match_digits(age) is not None and MIN_AGE <= int(age) <= MAX_AGE:
             return True
         print_error_message(
-            "Age must be a positive number between 18 and 99 in a valid numeric format."
+            f"Age must be a positive number between {MIN_AGE} and {MAX_AGE} "
+            "in a valid numeric format."
         )
         return False
 
@@ -173,7 +396,7 @@ class Validator:
         """
 
         # Check if phone is a digit and has a length of 10
-        if phone.isdigit() and len(phone) == 10:
+        if _match_phone(phone) is not None:
             return True
         print_error_message(
             "Phone number must be a 10-digit number in a valid numeric format."
@@ -201,7 +424,9 @@ class Validator:
 
 # The @dataclass decorator automatically generates special methods
 # such as __init__, __repr__, __eq__, etc., based on the class attributes.
-@dataclass
+# slots=True stores the attributes in fixed slots instead of a per-instance __dict__,
+# which uses less memory and makes attribute access faster (requires Python 3.10+).
+@dataclass(slots=True)
 class Employee:
     """
     Represents an employee with various attributes.
@@ -225,6 +450,22 @@ class Employee:
     # The Optional[] type hint indicates that this attribute can be either an ObjectId or None.
     _id: Optional[ObjectId] = None  # Employee ID, default to None if not provided
 
+    @classmethod
+    def from_document(cls, document):
+        """
+        Create an Employee object from an employee document.
+
+        Only the Employee fields are read from the document, so any other field,
+        such as one added by a projection, is skipped.
+
+        Parameters:
+        - document (dict): The employee document retrieved from the database.
+
+        Returns:
+        - Employee: The Employee object created from the document.
+        """
+        return cls(*_get_document_fields(document), document.get("_id"))
+
     def get_id(self):
         """
         Getter method to access the employee ID.
@@ -240,15 +481,86 @@ class Employee:
                 including name, designation, salary, age, phone number,
                 address.
         """
-        data = {
-            "name": self.name,
-            "designation": self.designation,
-            "salary": self.salary,
-            "age": self.age,
-            "phone": self.phone,
-            "address": self.address,
-        }
-        return data  # Return the dictionary representation of the employee
+        # Pair the field names with the values read by the attribute getter
+        return dict(zip(_EMPLOYEE_FIELDS, _get_employee_fields(self)))
+
+    def to_insert_doc(self):
+        """
+        Convert the Employee object to a document ready to be inserted.
+
+        Returns:
+        - dict: The dictionary representation of the Employee object, including its
+                ID if it has one, which can be passed directly to insert_one or InsertOne.
+        """
+        document = self.to_dict()
+        if self._id is not None:
+            document["_id"] = self._id
+        return document
+
+
+# Wire protocol compressors in order of preference, skipping the ones whose optional
+# module is not installed so PyMongo does not warn about them on every start
+_COMPRESSORS = ",".join(
+    name
+    for name, module in (("zstd", "zstandard"), ("snappy", "snappy"), ("zlib", "zlib"))
+    if importlib.util.find_spec(module) is not None
+)
+
+
+# The cache makes every Database created with the same URI share one connection pool
+@functools.lru_cache(maxsize=None)
+def _get_client(uri):
+    """
+    Get the MongoClient for the provided URI, creating it on first use.
+
+    A MongoClient is a thread-safe connection pool, so it should be created once per
+    process and reused instead of being created per request. It is also fork-safe,
+    but a child process should create its own client after forking.
+
+    Parameters:
+    - uri (str): The MongoDB URI: Uniform Resource Identifier.
+
+    Returns:
+    - MongoClient: The shared client connected to the provided URI.
+    """
+    return MongoClient(
+        uri,
+        serverSelectionTimeoutMS=5000,
+        connectTimeoutMS=5000,
+        # Compress the messages with the first compressor also supported by the server
+        compressors=_COMPRESSORS,
+        zlibCompressionLevel=6,
+        # The system is single-threaded, so a small pool is enough
+        maxPoolSize=4,
+        minPoolSize=1,
+        # Close connections that have been idle for more than a minute
+        maxIdleTimeMS=60000,
+    )
+
+
+# Threads running database reads that overlap with other work
+# Only a couple of reads overlap at a time, so two workers are enough
+_BACKGROUND_READS = ThreadPoolExecutor(max_workers=2)
+
+
+def _as_object_id(emp_id):
+    """
+    Convert an employee ID to the ObjectId it is stored as in the database.
+
+    Employee IDs are stored as ObjectIds, so a string ID would never match.
+
+    Parameters:
+    - emp_id (ObjectId or str): The ID of the employee.
+
+    Returns:
+    - ObjectId: The ID of the employee as an ObjectId.
+
+    Raises:
+    - InvalidId: If the string is not a valid ObjectId.
+    """
+    if isinstance(emp_id, ObjectId):
+        return emp_id
+    return ObjectId(emp_id)
 
 
 class Database:
@@ -262,16 +574,58 @@ class Database:
 
     # Initialize the Database class with a MongoDB URI: Uniform Resource Identifier.
     def __init__(self, uri):
-        # Connect to MongoDB using the provided URI
-        self.client = MongoClient(
-            uri, serverSelectionTimeoutMS=5000, connectTimeoutMS=5000
-        )
+        # Connect to MongoDB using the shared client for the provided URI
+        self.client = _get_client(uri)
         # Access the 'employees' database
         self.db = self.client.employees
         # Access the 'users' collection within the 'employees' database
         self.users = self.db.users
         # Access the 'staff' collection within the 'employees' database
         self.staff = self.db.staff
+        # Make sure the queries run by the system are backed by indexes
+        self.create_indexes()
+
+    def create_indexes(self):
+        """
+        Create the indexes used by the login and search queries if they do not exist.
+
+        The unique index on 'users.email' turns the login lookup into an index seek,
+        the text index on the 'staff' search fields backs the word search, and
+        the single field indexes back the anchored prefix search.
+        """
+        indexes = [
+            (self.users, "email", {"unique": True}),
+            (
+                self.staff,
+                [("name", "text"), ("designation", "text"), ("address", "text")],
+                {},
+            ),
+            *((self.staff, field, {}) for field in ("name", "designation", "address")),
+        ]
+
+        failed = False
+        # Create each index on its own, so one failed build does not skip the others
+        for collection, keys, options in indexes:
+            try:
+                collection.create_index(keys, **options)
+            except pymongo.errors.AutoReconnect:
+                # The other indexes would each wait for the server selection timeout,
+                # so stop at the first connection error
+                print_error_message(
+                    "Lost connection to MongoDB while creating indexes."
+                )
+                failed = True
+                break
+            except pymongo.errors.OperationFailure:
+                print_error_message(
+                    f"Failed to create the index on {collection.name} in MongoDB."
+                )
+                failed = True
+
+        # The screen is cleared before the login menu,
+        # so wait for the user to read the messages first
+        if failed:
+            pause_screen()
 
     def find_user_by_email(self, email):
         """
@@ -281,135 +635,191 @@ class Database:
             email (str): The email of the user to search for.
 
         Returns:
-            dict or None: The user document if found, otherwise None.
+            dict or None: The user document with only the password if found, otherwise None.
         """
         try:
-            return self.users.find_one({"email": email})
+            # Only fetch the password, the only field needed to log in
+            return self.users.find_one({"email": email}, {"password": 1, "_id": 0})
         except pymongo.errors.AutoReconnect:
             print_error_message(
                 "Lost connection to MongoDB while finding user by email."
             )
             return False
 
-    def get_employee_list(self):
+    def get_employee_list(self, page_size=50, after_id=None):
         """
-        Retrieve a list of all employees from the database.
+        Retrieve one page of employees from the database.
 
-        Returns:
-            list: A list of Employee objects representing the employees in the database.
-        """
-        try:
-            # Retrieve all documents from the collection
-            employee_documents = self.staff.find()
+        Pages are read in ascending '_id' order using keyset pagination, so every
+        page is an index seek on '_id' instead of a skip over the earlier pages.
+        The employees are streamed from the cursor as they arrive.
+
+        Args:
+            page_size (int): The maximum number of employees to return.
+            after_id (ObjectId, optional): The '_id' of the last employee of the
+                previous page. If None, the first page is returned.
 
-            # Initialize an empty list to store Employee objects
-            employee_list = []
+        Yields:
+            Employee: The employees of the page. The ID of the last employee yielded
+                is the cursor token to pass as after_id for the next page.
 
-            if employee_documents:
-                # Iterate over each document in the employee_documents
-                for emp in employee_documents:
-                    # Create an Employee object using the data from the document
-                    # Unpacks the dictionary 'emp',
-                    # into individual key-value pairs for the Employee constructor
-                    employee = Employee(**emp)
+        Raises:
+            pymongo.errors.AutoReconnect: If the connection is lost, after printing
+                an error message, so a lost connection can be told from an empty page.
+        """
+        try:
+            # Only fetch documents after the last seen ID when continuing a listing
+            query = {"_id": {"$gt": after_id}} if after_id is not None else {}
 
-                    # Append the created Employee object to the list
-                    employee_list.append(employee)
+            # Retrieve a single page of documents from the collection
+            employee_documents = (
+                self.staff.find(query, _PROJECTION).sort("_id", 1).limit(page_size)
+            )
 
-            # Return the list of Employee objects
-            return employee_list
+            # Iterate over each document in the employee_documents
+            for emp in employee_documents:
+                # Create an Employee object using the data from the document
+                yield Employee.from_document(emp)
         except pymongo.errors.AutoReconnect:
             print_error_message(
                 "Lost connection to MongoDB while retrieving employees list."
             )
+            raise
 
-        # Explicitly return None if no employees are found
-        return None
-
-    def insert_employee(self, employee):
+    def count_employees(self):
         """
-        Insert a new employee into the database.
+        Get the number of employees in the database for display purposes.
 
-        Args:
-            employee (Employee): The Employee object to be inserted.
+        The count is read from the collection metadata instead of scanning
+        the collection, so it may be slightly off after an unclean shutdown.
 
         Returns:
-            bool: True if the insertion was successful, False otherwise.
+            int or None: The estimated number of employees, or None if the connection was lost.
         """
         try:
-            # Convert employee object to a dictionary before insertion
-            employee_data = employee.to_dict()
+            return self.staff.estimated_document_count()
+        except pymongo.errors.AutoReconnect:
+            print_error_message("Lost connection to MongoDB while counting employees.")
+            return None
+
+    def count_employees_in_background(self):
+        """
+        Start counting the employees in a background thread.
 
-            # Insert the employee data into the collection
-            result = self.staff.insert_one(employee_data)
+        The shared MongoClient is thread-safe, so the count can run while
+        the same Database is used to fetch employees.
 
-            # Check if insertion was successful
-            return bool(result.inserted_id)
-        except pymongo.errors.AutoReconnect:
+        Returns:
+            Future: A future whose result is the value returned by count_employees.
+        """
+        return _BACKGROUND_READS.submit(self.count_employees)
+
+    def bulk_apply(self, ops):
+        """
+        Apply a batch of write operations to the database in a single round trip.
+
+        Args:
+            ops (list): The pymongo InsertOne, UpdateOne and DeleteOne operations to apply.
+
+        Returns:
+            BulkWriteResult or None: The result of the batch if it was applied, None otherwise.
+        """
+        try:
+            # Unordered batches let the server apply the operations in any order
+            # and keep going when a single operation fails
+            return self.staff.bulk_write(ops, ordered=False)
+        except pymongo.errors.BulkWriteError as error:
             print_error_message(
-                "Lost connection to MongoDB while inserting employee details."
+                f"{len(error.details['writeErrors'])} of {len(ops)} changes "
+                "could not be saved."
             )
-            return False  # Failed addition due to exception
+            return None
+        except pymongo.errors.AutoReconnect:
+            print_error_message("Lost connection to MongoDB while saving changes.")
+            return None
 
     def get_employee_by_id(self, emp_id):
         """
         Retrieve an employee from the database based on their ID.
 
         Args:
-            emp_id (str): The ID of the employee to retrieve.
+            emp_id (ObjectId or str): The ID of the employee to retrieve.
 
         Returns:
             Employee or None: The Employee object if found, None if not found.
         """
         try:
             # Find the employee document by its ID in the collection
-            emp = self.staff.find_one({"_id": emp_id})
+            emp = self.staff.find_one({"_id": _as_object_id(emp_id)}, _PROJECTION)
 
             # If an employee document is found,
             if emp:
                 # Create an Employee object from the document
-                # Unpacks the dictionary 'emp',
-                # into individual key-value pairs for the Employee constructor
-                employee = Employee(**emp)
+                employee = Employee.from_document(emp)
 
                 # Return the created Employee object
                 return employee
             # If no employee document is found, return None
             return None
+        except InvalidId:
+            # No employee can have an ID that is not a valid ObjectId
+            print_error_message(f"Invalid employee ID: {emp_id}")
+            return None
         except pymongo.errors.AutoReconnect:
             print_error_message(
                 "Lost connection to MongoDB while getting employee details."
             )
             return False
 
-    def update_employee_by_id(self, emp_id, employee):
+    def update_employee_by_id(self, emp_id, employee, current=None):
         """
         Update an employee's information in the database based on their ID.
 
         Args:
-            emp_id (str): The ID of the employee to update.
+            emp_id (ObjectId or str): The ID of the employee to update.
             employee (Employee): The updated Employee object containing the new information.
+            current (Employee, optional): The Employee object with the current information.
+                If provided, only the fields that differ from it are updated.
 
         Returns:
-            bool: True if the update was successful, False otherwise.
+            bool: True if the update was successful, None if there was nothing to
+                change, False otherwise.
         """
-        try:
-            # Convert employee object to a dictionary
-            employee_data = employee.to_dict()
+        # Convert employee object to a dictionary
+        employee_data = employee.to_dict()
+
+        if current is not None:
+            # Only keep the fields that differ from the current information
+            current_data = current.to_dict()
+            employee_data = {
+                field: value
+                for field, value in employee_data.items()
+                if current_data[field] != value
+            }
+
+            # Skip the round trip to the database if nothing has changed
+            if not employee_data:
+                return None
 
+        try:
             # Update the employee document in the collection with the provided ID
             update_result = self.staff.update_one(
-                {"_id": emp_id},
+                {"_id": _as_object_id(emp_id)},
                 {
                     # Use $set operator to update specific fields
                     "$set": employee_data
                 },
+                # Never create a new employee if the ID does not exist
+                upsert=False,
             )
 
             # Check if any document was modified during the update operation
             if update_result.modified_count > 0:
                 return True
             return None  # No documents were modified
+        except InvalidId:
+            print_error_message(f"Invalid employee ID: {emp_id}")
+            return False
         except pymongo.errors.AutoReconnect:
             return False
 
@@ -418,74 +828,130 @@ class Database:
         Remove an employee from the database based on their ID.
 
         Args:
-            emp_id (str): The ID of the employee to remove.
+            emp_id (ObjectId or str): The ID of the employee to remove.
 
         Returns:
             bool: True if the removal was successful, False otherwise.
         """
         try:
             # Delete the employee document from the collection with the provided ID
-            delete_result = self.staff.delete_one({"_id": emp_id})
+            delete_result = self.staff.delete_one({"_id": _as_object_id(emp_id)})
 
             # Check if any document was deleted during the operation
             if delete_result.deleted_count > 0:
                 return True
             return False
+        except InvalidId:
+            print_error_message(f"Invalid employee ID: {emp_id}")
+            return False
         except pymongo.errors.AutoReconnect:
             print_error_message("Lost connection to MongoDB while deleting employee.")
             return False
 
+    @staticmethod
+    def build_search_query(pattern, options):
+        """
+        Build a query matching a regular expression against the search fields.
+
+        Args:
+            pattern (str): The regular expression pattern to match, already escaped.
+            options (str): The options for the regular expression, e.g. "i".
+
+        Returns:
+            dict: The query matching employee names, designations, or addresses.
+        """
+        # The same regular expression condition is shared by all the search fields
+        condition = {"$regex": pattern, "$options": options}
+        return {
+            # Using $or operator to search for documents,
+            # that match any of the specified conditions
+            "$or": [
+                {"name": condition},  # Search by name
+                {"designation": condition},  # Search by designation
+                {"address": condition},  # Search by address
+            ]
+        }
+
     def search_employee(self, term):
         """
         Search for employees in the database based on a search term.
 
+        Plain words are matched with the text index, so an employee matches when any
+        of the words appears in their name, designation, or address, and the best
+        matches are returned first. Any other term is matched case-sensitively from
+        the start of those fields, which can seek the field indexes. A term starting
+        with SUBSTRING_SEARCH_PREFIX is matched anywhere in those fields, ignoring
+        case, which has to scan every employee.
+
         Args:
             term (str): The search term to match against employee names, designations, or addresses.
 
-        Returns:
-            list: A list of Employee objects matching the search term.
+        Yields:
+            Employee: The employees matching the search term.
         """
         try:
-            # Search for employee documents in the collection based on the provided term
-            search_results = self.staff.find(
-                {
-                    # Using $or operator to search for documents,
-                    # that match any of the specified conditions
-                    "$or": [
-                        {
-                            "name": {  # Field to search: "name"
-                                # Regular expression pattern to match against the "name" field
-                                "$regex": term,
-                                # Options for the regular expression:
-                                # "i" for case-insensitive matching
-                                "$options": "i",
-                            }
-                        },
-                        {
-                            "designation": {"$regex": term, "$options": "i"}
-                        },  # Search by designation (case-insensitive)
-                        {
-                            "address": {"$regex": term, "$options": "i"}
-                        },  # Search by address (case-insensitive)
-                    ]
-                }
-            )
-
-            # Create Employee objects from the search results and return them as a list
-            # Define an empty list to store the Employee objects
-            result_list = []
-
-            # Iterate over each dictionary in search_results
-            for emp in search_results:
-                # Create an Employee object using the dictionary emp and add it to the result_list
-                employee_object = Employee(**emp)
-                result_list.append(employee_object)
+            # Only fetch the fields used to create the Employee objects
+            projection = _PROJECTION
+            sort = None
+            text_search = False
+
+            if term.startswith(SUBSTRING_SEARCH_PREFIX):
+                # Match the rest of the term anywhere in the fields,
+                # "i" for case-insensitive matching
+                query = self.build_search_query(
+                    re.escape(term[len(SUBSTRING_SEARCH_PREFIX) :]), "i"
+                )
+            elif _REGEX_METACHARACTERS.search(term) is None:
+                # Search plain words with the text index on the search fields,
+                # returning the best matching employees first
+                query = {"$text": {"$search": term}}
+                projection = {**_PROJECTION, "score": _TEXT_SCORE}
+                sort = [("score", _TEXT_SCORE)]
+                text_search = True
+            else:
+                # Anchor the escaped term to the start of the fields and match it
+                # case-sensitively, so the query is an index range scan
+                query = self.build_search_query(f"^{re.escape(term)}", "")
 
-            # Return the result_list
-            return result_list
+            try:
+                yield from self._find_employees(query, projection, sort)
+            except pymongo.errors.OperationFailure:
+                # The server rejects the text search if the text index is missing,
+                # before any employee is returned
+                if not text_search:
+                    raise
+                # Match the escaped term anywhere in the fields instead,
+                # "i" for case-insensitive matching
+                query = self.build_search_query(re.escape(term), "i")
+                yield from self._find_employees(query, _PROJECTION, None)
         except pymongo.errors.AutoReconnect:
+            # Stop yielding employees once the connection is lost
             print_error_message("Lost connection to MongoDB while searching employee.")
-            return []
+        except pymongo.errors.OperationFailure:
+            # Stop yielding employees if the server rejects the query
+            print_error_message("Failed to search employees in MongoDB.")
+
+    def _find_employees(self, query, projection, sort):
+        """
+        Find the employees matching a query.
+
+        Args:
+            query (dict): The query to match the employee documents against.
+            projection (dict): The fields to fetch from the employee documents.
+            sort (list or None): The sort order of the employees, if any.
+
+        Yields:
+            Employee: The employees matching the query.
+        """
+        # Search for employee documents in the collection based on the query
+        # Search results are usually a few hundred employees at most, so a first
+        # batch of 500 instead of the default 101 saves a getMore round trip
+        search_results = self.staff.find(query, projection, sort=sort, batch_size=500)
+
+        # Iterate over each dictionary in search_results
+        for emp in search_results:
+            # Create an Employee object using the dictionary emp
+            yield Employee.from_document(emp)
 
 
 class EmployeeManagementSystem:
@@ -501,6 +967,13 @@ class EmployeeManagementSystem:
             with the provided database connection.
         id_mapping (dict): A dictionary to store mappings of employee IDs to objects.
             This is used to keep track of Employee objects created during runtime.
+        _emp_cache (dict): The chunks of employees read from the database, keyed by
+            the ID of the employee before each chunk (None for the first chunk).
+        _emp_total (int or None): The cached total number of employees.
+        _emp_read_failed (bool): Whether the connection was lost while the employees
+            were last read, so no employees does not mean there are none.
+        _screen_dirty (bool): Whether the employee list has to be drawn again
+            by the modify and delete menus.
     """
 
     def __init__(self, uri):
@@ -511,16 +984,75 @@ class EmployeeManagementSystem:
         # This will be used to keep track of Employee objects created during runtime
         self.id_mapping = {}
 
-    def update_id_mapping(self, employees):
+        # Cache of the employees read from the database, so screens that are shown
+        # again only query the database after the employees have been changed
+        self._emp_cache = {}
+        self._emp_total = None
+        self._emp_read_failed = False
+
+        # Set when the employee list shown by the modify and delete menus is out of date
+        self._screen_dirty = True
+
+    def _employee_chunks(self):
         """
-        Update the ID mapping based on the provided list of employees.
+        Iterate over the employees in chunks of TABLE_CHUNK_SIZE, only reading
+        the chunks that are not cached yet from the database.
 
-        Args:
-        - employees (list): A list of Employee objects retrieved from the database.
+        If the connection is lost, the iteration stops and _emp_read_failed is set.
+
+        Yields:
+        - list: The Employee objects of each chunk, in ascending '_id' order.
         """
-        self.id_mapping.clear()  # Clear the existing ID mapping
-        for i, emp in enumerate(employees, start=1):
-            self.id_mapping[i] = emp.get_id()
+        self._emp_read_failed = False
+        after_id = None
+        while True:
+            chunk = self._emp_cache.get(after_id)
+            if chunk is None:
+                try:
+                    # One extra employee tells whether another chunk follows
+                    employees = list(
+                        self.database.get_employee_list(
+                            page_size=TABLE_CHUNK_SIZE + 1, after_id=after_id
+                        )
+                    )
+                except pymongo.errors.AutoReconnect:
+                    # The error message has already been printed
+                    self._emp_read_failed = True
+                    return
+                chunk = (
+                    employees[:TABLE_CHUNK_SIZE],
+                    len(employees) > TABLE_CHUNK_SIZE,
+                )
+                self._emp_cache[after_id] = chunk
+
+            employees, has_more = chunk
+            if employees:
+                yield employees
+
+            # Stop after the last chunk
+            if not has_more:
+                return
+
+            # Continue after the last employee of the chunk
+            after_id = employees[-1].get_id()
+
+    def _employees(self):
+        """
+        Iterate over all the employees, reading them from the cache when possible.
+
+        Returns:
+        - iterator: The Employee objects in ascending '_id' order.
+        """
+        return itertools.chain.from_iterable(self._employee_chunks())
+
+    def _invalidate_employees(self):
+        """
+        Clear the cached employees after they have been changed in the database.
+        """
+        self._emp_cache.clear()
+        self._emp_total = None
+        # The employee list on the screen no longer matches the database
+        self._screen_dirty = True
 
     def display_employee_details(self, emp_id, employee):
         """
@@ -533,19 +1065,36 @@ class EmployeeManagementSystem:
         Prints the details of the specified employee, including ID, name, designation,
         salary, age, phone number, and address.
         """
-        data = []
-        employee_dict = {
-            "ID": emp_id,
-            "Name": employee.name,
-            "Designation": employee.designation,
-            "Salary": employee.salary,
-            "Age": employee.age,
-            "Phone": employee.phone,
-            "Address": employee.address,
-        }
-        data.append(employee_dict)
-        for data_dict in data:
-            print(tabulate(data_dict.items(), tablefmt="fancy_grid"))
+        # Convert the details to strings in the order of the table labels
+        values = [
+            str(value)
+            for value in (
+                emp_id,
+                employee.name,
+                employee.designation,
+                employee.salary,
+                employee.age,
+                employee.phone,
+                employee.address,
+            )
+        ]
+
+        # The table has a fixed shape, so only the width of the value column
+        # has to be measured before formatting the rows
+        # Values are padded by their display width, as wide characters take up
+        # two columns in the terminal
+        value_widths = list(map(_get_display_width(), values))
+        width = max(value_widths)
+        rows = [
+            f"│ {label:<{_DETAIL_LABEL_WIDTH}} │ {value}{' ' * (width - size)} │"
+            for label, value, size in zip(_EMPLOYEE_COLUMNS, values, value_widths)
+        ]
+        separator = f"\n{_DETAIL_SEPARATOR}{'─' * (width + 2)}┤\n"
+        print(
+            f"{_DETAIL_TOP}{'═' * (width + 2)}╕\n"
+            f"{separator.join(rows)}\n"
+            f"{_DETAIL_BOTTOM}{'═' * (width + 2)}╛"
+        )
 
     def login(self):
         """
@@ -565,8 +1114,12 @@ class EmployeeManagementSystem:
 
             # Check if a user with the provided email exists in the database
             user = self.database.find_user_by_email(email)
+            # Compare the passwords in constant time to avoid leaking timing information
+            password_matches = bool(user) and hmac.compare_digest(
+                user["password"].encode(), password.encode()
+            )
             # If user exists and provided password matches the stored password, log in
-            if user and user["password"] == password:
+            if password_matches:
                 # Notify the user about successful login
                 print_success_message("Login successful!")
                 pause_screen()
@@ -576,7 +1129,7 @@ class EmployeeManagementSystem:
                 # Exit the login loop
                 break
 
-            if user and user["password"] != password:
+            if user and not password_matches:
                 # Notify the user about invalid password
                 print_error_message("Invalid password! Please try again.")
             elif user is None:
@@ -588,20 +1141,15 @@ class EmployeeManagementSystem:
             )
             retry = True
             while retry:
-                # Add a short delay to prevent instant confirmation due to fast key presses
-                time.sleep(0.2)
-                invalid_credentials_key_pressed = keyboard.read_event(
-                    suppress=True
-                ).name
+                # Block until a key is typed in the console
+                invalid_credentials_key_pressed = wait_enter_or_esc()
                 if invalid_credentials_key_pressed == "esc":
                     print_information_message("\nReturning to the login menu...")
-                    time.sleep(0.2)
                     retry = False
                     break
 
                 if invalid_credentials_key_pressed == "enter":
                     print_information_message("\nRetrying...")
-                    time.sleep(0.2)
                     retry = True
                     break
             if retry:
@@ -623,22 +1171,7 @@ class EmployeeManagementSystem:
         while True:
             try:
                 clear_screen()
-                print(
-                    """
-                    ================================
-                       EMPLOYEE MANAGEMENT SYSTEM    
-                    ================================
-                    
-                          *** LOGIN MENU ***      
-                     ______________________________
-                    |                              |
-                    |_______ 1) Login _____________|
-                    |                              |
-                    |_______ 2) Exit ______________|
-                    |                              |
-                    |______________________________|
-                    """
-                )
+                print_menu(LOGIN_MENU)
                 # Get user choice
                 choice = int(input("\n\t\t    Select any option: "))
                 if choice == 1:
@@ -670,39 +1203,14 @@ class EmployeeManagementSystem:
         Returns:
             None
         """
-        # Retrieve all employees from the database
-        all_employees = self.database.get_employee_list()
-
-        # Check if there are employees in the database
-        if all_employees:
-            # Iterate over each employee and their index, starting from 1
-            for i, emp in enumerate(all_employees, start=1):
-                # Store the employee ID in the id_mapping dictionary using the index i
-                # Access _id using the get_id() method
-                self.id_mapping[i] = emp.get_id()
+        # Map the display IDs to the employee IDs in a single pass over the cached employees
+        self.id_mapping = {
+            i: emp.get_id() for i, emp in enumerate(self._employees(), start=1)
+        }
 
         while True:
             clear_screen()
-            print(
-                """
-                    ==================================
-                        EMPLOYEE MANAGEMENT SYSTEM    
-                    ==================================
-                    
-                           *** MAIN MENU ***       
-                     ________________________________
-                    |                                |
-                    |____ 1) View Employees List ____|
-                    |                                |
-                    |____ 2) Edit Employees List ____|
-                    |                                |
-                    |____ 3) Search Record __________|
-                    |                                |
-                    |____ 4) Logout_________________ |
-                    |                                |
-                    |________________________________|
-                """
-            )
+            print_menu(MAIN_MENU)
 
             try:
                 # Get user choice
@@ -748,26 +1256,7 @@ class EmployeeManagementSystem:
         while True:
             try:
                 clear_screen()
-                print(
-                    """
-                    ============================
-                     EMPLOYEE MANAGEMENT SYSTEM  
-                    ============================
-                    
-                    *** EDIT EMPLOYEE LIST ***
-                     __________________________
-                    |                          |
-                    |______ 1) Add ____________|
-                    |                          |
-                    |______ 2) Modify _________|
-                    |                          |
-                    |______ 3) Delete _________|
-                    |                          |
-                    |______ 4) Main Menu ______|
-                    |                          |
-                    |__________________________|
-                    """
-                )
+                print_menu(EDIT_MENU)
                 # Prompt for user input
                 choice = int(input("\n\t\t    Select any option: "))
 
@@ -804,56 +1293,52 @@ class EmployeeManagementSystem:
         # Clear the screen before displaying the employee list
         clear_screen()
 
-        # Retrieve all employees from the database
-        all_employees = self.database.get_employee_list()
-
-        # Check if there was an error while retrieving employees
-        if all_employees is None:
-            return
-
-        # Check if there are any employees
-        if all_employees:
-            # Define the header for the employee list table
-            header = [
-                "ID",
-                "Name",
-                "Designation",
-                "Salary",
-                "Age",
-                "Phone",
-                "Address",
+        # Count the employees in the background while the first chunk is fetched,
+        # unless the total is already cached
+        # The total is read from the collection metadata instead of counting
+        total_future = None
+        if self._emp_total is None:
+            total_future = self.database.count_employees_in_background()
+
+        # The ID mapping is rebuilt while the list is displayed
+        self.id_mapping.clear()
+
+        # Display ID of the next employee
+        index = 1
+
+        # Retrieve the employees one chunk at a time
+        for chunk_number, employees in enumerate(self._employee_chunks()):
+            # Format the data of each employee for display,
+            # converting the phone number to string for formatting
+            data = [
+                [i, e.name, e.designation, e.salary, e.age, str(e.phone), e.address]
+                for i, e in enumerate(employees, start=index)
             ]
 
-            # Initialize an empty list to hold the formatted employee data
-            data = []
-
-            # Iterate over each employee and format their data for display
-            index = 1
-            for employee in all_employees:
-                # Within each iteration, employee variable holds one employee object
-                # from all_employees list
-                i = index  # Assign the current index to i
-                index += 1
-
-                # Convert phone number to string for formatting
-                phone_number = str(employee.phone)
-
-                # Append employee data to the list for tabulation
-                data.append(
-                    [
-                        i,  # Employee ID
-                        employee.name,
-                        employee.designation,
-                        employee.salary,
-                        employee.age,
-                        phone_number,
-                        employee.address,
-                    ]
+            # Extend the ID mapping with the employees of the chunk
+            self.id_mapping.update(
+                (i, e.get_id()) for i, e in enumerate(employees, start=index)
+            )
+            index += len(employees)
+
+            # Display the total above the first chunk once the count has finished
+            if chunk_number == 0:
+                if total_future is not None:
+                    self._emp_total = total_future.result()
+                if self._emp_total:
+                    print(f"Total employees: {self._emp_total}")
+
+            # Print the formatted chunk of the employee list using tabulate
+            print(
+                _get_tabulate()(
+                    data,
+                    headers=_EMPLOYEE_COLUMNS,
+                    tablefmt="fancy_grid",
+                    disable_numparse=_TEXT_COLUMNS,
                 )
+            )
 
-            # Print the formatted employee list using tabulate
-            print(tabulate(data, headers=header, tablefmt="fancy_grid"))
-        else:
+        if index == 1 and not self._emp_read_failed:
             # Print a message if no employees are found
             print_error_message("No employees found.")
 
@@ -864,12 +1349,16 @@ class EmployeeManagementSystem:
         This method prompts the user to input various details for a new employee,
         such as name, designation, salary, age, phone number, and address. It validates
         each input using the Validator class. After successful validation, an Employee
-        object is created and added to the database. The user can choose to add more
-        employees or return to the edit menu.
+        object is created and queued for insertion. The user can choose to add more
+        employees, and all the queued employees are inserted into the database with
+        a single batch before returning to the edit menu.
 
         Returns:
             None
         """
+        # Insert operations waiting to be written to the database in one batch
+        pending_ops = []
+
         while True:
             clear_screen()
             print("\n*** Add Employee Details ***\n")
@@ -883,13 +1372,13 @@ class EmployeeManagementSystem:
             )
             salary = float(
                 get_valid_input(
-                    "\nSalary (must be a number, minimum 500): ",
+                    f"\nSalary (must be a number, minimum {MIN_SALARY}): ",
                     Validator.validate_salary,
                 )
             )
             age = int(
                 get_valid_input(
-                    "\nAge (must be a number from 18 to 99): ",
+                    f"\nAge (must be a number from {MIN_AGE} to {MAX_AGE}): ",
                     Validator.validate_age,
                 )
             )
@@ -907,33 +1396,20 @@ class EmployeeManagementSystem:
                 "Press 'Enter' to add employee details or 'esc' to cancel..."
             )
             while True:
-                # Add a short delay to prevent instant confirmation due to fast key presses
-                time.sleep(0.2)
-
-                # Read the key pressed by the user while suppressing the input
-                add_employee_key_pressed = keyboard.read_event(suppress=True).name
+                # Read the key pressed by the user without echoing it
+                add_employee_key_pressed = wait_enter_or_esc()
 
                 if add_employee_key_pressed == "esc":
                     # If the user presses 'esc', cancel the operation
                     print_information_message("\nCanceling...")
-                    time.sleep(0.2)
                     print_error_message("\nOperation Canceled.")
                     break
 
                 if add_employee_key_pressed == "enter":
-                    print_information_message("\nAdding...")
-                    time.sleep(0.2)
-                    # If the user presses 'enter', attempt to add the employee to the database
-                    if self.database.insert_employee(employee):
-                        # Retrieve all employees from the database
-                        all_employees = self.database.get_employee_list()
-
-                        # Update the ID mapping after adding the employee
-                        if all_employees:
-                            self.update_id_mapping(all_employees)
-                        # Notify the user about the successful addition of employee details
-                        print_success_message("\nEmployee details added successfully!")
-                        break
+                    # If the user presses 'enter', queue the employee for insertion
+                    pending_ops.append(InsertOne(employee.to_insert_doc()))
+                    # Notify the user that the employee details will be added
+                    print_success_message("\nEmployee details queued for adding.")
                     break
 
             # After successfully adding an employee, ask if the user wants to add more
@@ -941,7 +1417,21 @@ class EmployeeManagementSystem:
                 ans = input("\nDo you want to add more employees? (Y/N): ")
 
                 if ans.lower() == "n":
-                    # If the user inputs 'n' (or 'N'), exit the loop and go back to the edit menu
+                    # If the user inputs 'n' (or 'N'), add the queued employees
+                    if pending_ops:
+                        print_information_message("Adding...")
+                        result = self.database.bulk_apply(pending_ops)
+                        # Some employees may have been added even if the batch failed
+                        self._invalidate_employees()
+                        # The ID mapping is rebuilt from the employees read again
+                        # by the next screen that displays them
+                        if result:
+                            # Notify the user about the successful addition of employee details
+                            print_success_message(
+                                f"\n{result.inserted_count} employee(s) added successfully!"
+                            )
+                        pause_screen()
+                    # Exit the loop and go back to the edit menu
                     self.edit_menu()
                     return
 
@@ -974,11 +1464,10 @@ class EmployeeManagementSystem:
             "Press 'Enter' to proceed with modifications or 'esc' to cancel..."
         )
         while True:
-            modify_employee_key_pressed = keyboard.read_event(suppress=True).name
+            modify_employee_key_pressed = wait_enter_or_esc()
 
             if modify_employee_key_pressed == "esc":
                 print_information_message("\nCanceling...")
-                time.sleep(0.2)
                 print_error_message("\nOperation Canceled.")
                 pause_screen()
                 self.modify_employee()
@@ -987,7 +1476,6 @@ class EmployeeManagementSystem:
             if modify_employee_key_pressed == "enter":
                 print()
                 print(f"\n*** Enter New Details for Employee ID: {employee_id} ***")
-                time.sleep(0.2)
 
                 new_name = (
                     get_valid_input(
@@ -1011,7 +1499,7 @@ class EmployeeManagementSystem:
 
                 new_salary = (
                     get_valid_input(
-                        f"\nSalary (must be a number, minimum 500, "
+                        f"\nSalary (must be a number, minimum {MIN_SALARY}, "
                         f"leave blank to keep '{employee.salary}'): ",
                         Validator.validate_salary,
                         allow_blank=True,
@@ -1021,7 +1509,7 @@ class EmployeeManagementSystem:
 
                 new_age = (
                     get_valid_input(
-                        f"\nAge (must be a number from 18 to 99, "
+                        f"\nAge (must be a number from {MIN_AGE} to {MAX_AGE}, "
                         f"leave blank to keep '{employee.age}'): ",
                         Validator.validate_age,
                         allow_blank=True,
@@ -1058,21 +1546,20 @@ class EmployeeManagementSystem:
                 )
 
                 print_information_message("Updating...")
-                time.sleep(0.2)
 
-                if self.database.update_employee_by_id(emp_id, updated_employee):
+                # Update the employee once and branch on the result
+                result = self.database.update_employee_by_id(
+                    emp_id, updated_employee, employee
+                )
+                if result:
+                    self._invalidate_employees()
                     print_success_message("\nEmployee updated successfully!")
-                    break
-
-                if (
-                    self.database.update_employee_by_id(emp_id, updated_employee)
-                    is None
-                ):
+                elif result is None:
                     print_error_message("\nNo changes found.")
-                    break
-                print_error_message(
-                    "\nLost connection to MongoDB while updating employee."
-                )
+                else:
+                    print_error_message(
+                        "\nLost connection to MongoDB while updating employee."
+                    )
                 break
 
     def modify_employee(self):
@@ -1089,15 +1576,23 @@ class EmployeeManagementSystem:
         Returns:
             None
         """
+        # The list is drawn when the menu is entered
+        self._screen_dirty = True
         while True:
-            clear_screen()
-            # Check if there are any employees
-            if not self.database.get_employee_list():
-                print_error_message("No employees found to modify.")
-                pause_screen()
-                break
-            # Display the current list of employees
-            self.display_employees_list()
+            # Only clear and redraw the list if it is no longer on the screen
+            # or the employees have changed
+            if self._screen_dirty:
+                clear_screen()
+                # Check if there are any employees
+                if next(self._employees(), None) is None:
+                    # A lost connection has already been reported
+                    if not self._emp_read_failed:
+                        print_error_message("No employees found to modify.")
+                    pause_screen()
+                    break
+                # Display the current list of employees
+                self.display_employees_list()
+                self._screen_dirty = False
 
             try:
                 # Prompt the user to input the ID of the employee to modify
@@ -1109,6 +1604,8 @@ class EmployeeManagementSystem:
                 if emp_id:
                     # Clear the screen after pressing 'Enter' to proceed
                     clear_screen()
+                    # The list has to be drawn again after the details are shown
+                    self._screen_dirty = True
                     # Retrieve the employee details from the database
                     employee = self.database.get_employee_by_id(emp_id)
 
@@ -1166,13 +1663,10 @@ class EmployeeManagementSystem:
             "Press 'Enter' to confirm deletion or 'esc' to cancel..."
         )
         while True:
-            # Add a short delay to prevent instant confirmation due to fast key presses
-            time.sleep(0.2)
-            # Read the key pressed by the user while suppressing the input
-            delete_employee_key_pressed = keyboard.read_event(suppress=True).name
+            # Read the key pressed by the user without echoing it
+            delete_employee_key_pressed = wait_enter_or_esc()
             if delete_employee_key_pressed == "esc":
                 print_information_message("\nCanceling...")
-                time.sleep(0.2)
                 print_error_message("\nOperation canceled.")
                 pause_screen()
                 self.delete_employee()
@@ -1180,9 +1674,9 @@ class EmployeeManagementSystem:
 
             if delete_employee_key_pressed == "enter":
                 print_information_message("\nDeleting...")
-                time.sleep(0.2)
                 # Remove the employee from the database
                 if self.database.remove_employee_by_id(emp_id):
+                    self._invalidate_employees()
                     print_success_message(
                         "\nEmployee deleted successfully!"
                     )  # Print success message if deletion was successful
@@ -1194,15 +1688,23 @@ class EmployeeManagementSystem:
         The user is prompted to enter the ID of the employee to delete.
         Once confirmed, the employee is removed from the database.
         """
+        # The list is drawn when the menu is entered
+        self._screen_dirty = True
         while True:
-            clear_screen()
-            # Check if there are any employees
-            if not self.database.get_employee_list():
-                print_error_message("No employees found to delete.")
-                pause_screen()
-                break
-            # Display the current list of employees
-            self.display_employees_list()
+            # Only clear and redraw the list if it is no longer on the screen
+            # or the employees have changed
+            if self._screen_dirty:
+                clear_screen()
+                # Check if there are any employees
+                if next(self._employees(), None) is None:
+                    # A lost connection has already been reported
+                    if not self._emp_read_failed:
+                        print_error_message("No employees found to delete.")
+                    pause_screen()
+                    break
+                # Display the current list of employees
+                self.display_employees_list()
+                self._screen_dirty = False
 
             try:
                 # Prompt the user to enter the ID of the employee to delete
@@ -1213,6 +1715,8 @@ class EmployeeManagementSystem:
                 if emp_id:
                     # Clear the screen after pressing 'Enter' to proceed
                     clear_screen()
+                    # The list has to be drawn again after the details are shown
+                    self._screen_dirty = True
                     # Retrieve the employee details from the database
                     employee = self.database.get_employee_by_id(emp_id)
 
@@ -1262,32 +1766,33 @@ class EmployeeManagementSystem:
         while True:
             clear_screen()
             # Prompt the user to enter the search term
-            search_term = input("Enter search term (name/designation/address): ")
+            search_term = input(
+                "Enter search term (name/designation/address, "
+                f"start with '{SUBSTRING_SEARCH_PREFIX}' to match anywhere): "
+            )
 
             # Search for employees based on the provided search term
             if len(search_term) > 0:
                 search_results = self.database.search_employee(search_term)
-                if search_results:
+
+                # Format the data of each matching employee for display
+                data = [
+                    [i, e.name, e.designation, e.salary, e.age, str(e.phone), e.address]
+                    for i, e in enumerate(search_results, start=1)
+                ]
+
+                if data:
                     clear_screen()
-                    data = []
-
-                    # Iterate through the search results and create a dictionary for each employee
-                    for i, employee in enumerate(search_results, start=1):
-                        employee_dict = {
-                            "ID": i,
-                            "Name": employee.name,
-                            "Designation": employee.designation,
-                            "Salary": employee.salary,
-                            "Age": employee.age,
-                            "Phone": employee.phone,
-                            "Address": employee.address,
-                        }
-                        data.append(employee_dict)
                     print()
-                    # Print each dictionary in 'data' using tabulate for a nicely formatted output
-                    for data_dict in data:
-                        print(tabulate(data_dict.items(), tablefmt="fancy_grid"))
-                        print()  # Add an empty line between dictionaries
+                    # Print all the matching records as a single table
+                    print(
+                        _get_tabulate()(
+                            data,
+                            headers=_EMPLOYEE_COLUMNS,
+                            tablefmt="fancy_grid",
+                            disable_numparse=_TEXT_COLUMNS,
+                        )
+                    )
                 else:
                     print_error_message(
                         f"No records found for {search_term}."
@@ -1299,10 +1804,9 @@ class EmployeeManagementSystem:
                     "Press 'enter' to continue searching or 'esc' to return to the main menu..."
                 )
                 while True:
-                    search_record_key_pressed = keyboard.read_event(suppress=True).name
+                    search_record_key_pressed = wait_enter_or_esc()
                     if search_record_key_pressed == "esc":
                         print_information_message("\nReturning to the edit menu...")
-                        time.sleep(0.2)
                         self.main_menu()
                         return  # Return to the edit menu if 'esc' is pressed
 
@@ -1331,6 +1835,7 @@ class EmployeeManagementSystem:
 # It is commonly used to include code that should only run
 # when the script is executed directly, not when it's imported
 if __name__ == "__main__":
+    enable_virtual_terminal()
     clear_screen()
     print_information_message("Starting Employee Management System...")
 
@@ -1339,10 +1844,8 @@ if __name__ == "__main__":
             # Retrieve MongoDB URI from the environment variables
             mongodb_uri = os.environ.get("MONGODB_URI")
 
-            # Create a Database instance using the provided URI
-            database = Database(mongodb_uri)
-
-            # Create a instance of the EmployeeManagementSystem class with the initialized database
+            # Create a instance of the EmployeeManagementSystem class, which creates
+            # its own Database instance from the URI
             system = EmployeeManagementSystem(mongodb_uri)
 
             # Start the Employee Management System by invoking the 'run' method
@@ -1354,16 +1857,14 @@ if __name__ == "__main__":
             # Inform the user about the option to retry or exit
             print_information_message("Press 'Enter' to retry or 'esc' to exit...")
             while True:
-                # Read the key pressed by the user while suppressing the input
-                key_pressed = keyboard.read_event(suppress=True).name
+                # Read the key pressed by the user without echoing it
+                key_pressed = wait_enter_or_esc()
                 if key_pressed == "esc":
                     # If the user presses 'esc', terminate the program
                     print_information_message("\nExiting...")
-                    time.sleep(0.2)
                     clear_screen()
                     sys.exit(0)
                 elif key_pressed == "enter":
                     # If the user presses 'enter', retry connecting to MongoDB
                     print_information_message("\nRetrying...")
-                    time.sleep(0.2)
                     break